@@ -1,8 +1,10 @@
 __package__ = 'abx.archivebox'
 
 import os
+import stat
 from pathlib import Path
-from typing import Type, Tuple, Callable, ClassVar
+from functools import lru_cache
+from typing import Type, Tuple, Callable, ClassVar, Dict, Any
 
 from benedict import benedict
 from pydantic import model_validator, TypeAdapter
@@ -18,8 +20,46 @@ from . import toml_util
 
 
 PACKAGE_DIR = Path(__file__).resolve().parent.parent
-DATA_DIR = Path(os.getcwd()).resolve()
+DATA_DIR = Path(os.getcwd())
 
+ARCHIVEBOX_CONFIG_FILE = DATA_DIR / "ArchiveBox.conf"
+ARCHIVEBOX_CONFIG_FILE_BAK = ARCHIVEBOX_CONFIG_FILE.parent / ".ArchiveBox.conf.bak"
+
+
+
+# default factories are fixed per field, so only inspect each one's signature once
+cached_func_takes_args_or_kwargs = lru_cache(maxsize=None)(func_takes_args_or_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _cached_type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    """get a TypeAdapter for a field annotation, reusing it instead of re-building its pydantic-core schema every time"""
+    try:
+        return _cached_type_adapter(annotation)
+    except TypeError:
+        # unhashable annotation (e.g. Annotated[...] with unhashable metadata), can't be cached
+        return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def get_field_names(settings_cls: type[BaseSettings]) -> frozenset[str]:
+    """names of all the fields defined on a settings class (computed once per class)"""
+    return frozenset(settings_cls.model_fields)
+
+
+@lru_cache(maxsize=None)
+def get_callable_default_fields(settings_cls: type[BaseSettings]) -> Tuple[str, ...]:
+    """names of the fields on a settings class whose default is a function to be computed by fill_defaults"""
+    return tuple(key for key, field in settings_cls.model_fields.items() if isinstance(field.default, Callable))
+
+
+# parsed TOML file contents keyed by (path, st_mtime_ns, st_size), so the file is only re-read + re-parsed when it changes
+_TOML_FILE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+# flattened + filtered toml_data for each (TOML file cache key, settings_cls) pair
+_TOML_DATA_CACHE: Dict[Tuple[Tuple[str, int, int], type], Dict[str, Any]] = {}
 
 
 class FlatTomlConfigSettingsSource(TomlConfigSettingsSource):
@@ -31,28 +71,83 @@ class FlatTomlConfigSettingsSource(TomlConfigSettingsSource):
         self,
         settings_cls: type[BaseSettings],
         toml_file: Path | None=None,
+        toml_stat: os.stat_result | None=None,
     ):
         self.toml_file_path = toml_file or settings_cls.model_config.get("toml_file")
         
-        self.nested_toml_data = self._read_files(self.toml_file_path)
-        self.toml_data = {}
-        for top_level_key, top_level_value in self.nested_toml_data.items():
-            if isinstance(top_level_value, dict):
-                # value is nested, flatten it
-                for key, value in top_level_value.items():
-                    self.toml_data[key] = value
-            else:
-                # value is already flat, just set it as-is
-                self.toml_data[top_level_key] = top_level_value
-                
-        # filter toml_data to only include keys that are defined on this settings_cls
+        try:
+            # reuse the stat result if the caller already has one for this file, saves a syscall per init
+            toml_stat = toml_stat or os.stat(self.toml_file_path)
+            cache_key = (str(self.toml_file_path), toml_stat.st_mtime_ns, toml_stat.st_size)
+        except (TypeError, OSError):
+            cache_key = None
+        
+        if cache_key and (cache_key, settings_cls) in _TOML_DATA_CACHE:
+            # file is unchanged since it was last loaded for this settings_cls, skip reading + flattening it again
+            self.nested_toml_data = _TOML_FILE_CACHE[cache_key]
+            self.toml_data = _TOML_DATA_CACHE[cache_key, settings_cls]
+            super(TomlConfigSettingsSource, self).__init__(settings_cls, dict(self.toml_data))
+            return
+        
+        if cache_key and cache_key in _TOML_FILE_CACHE:
+            self.nested_toml_data = _TOML_FILE_CACHE[cache_key]
+        else:
+            self.nested_toml_data = self._read_files(self.toml_file_path)
+            if cache_key:
+                # file changed (or first load), forget any entries for older versions of it
+                _TOML_FILE_CACHE.clear()
+                _TOML_DATA_CACHE.clear()
+                _TOML_FILE_CACHE[cache_key] = self.nested_toml_data
+        
+        # flatten nested_toml_data and filter it to only include keys that are defined on this settings_cls, in one pass
+        field_names = get_field_names(settings_cls)
         self.toml_data = {
             key: value
-            for key, value in self.toml_data.items()
-            if key in settings_cls.model_fields
+            for key, value in self._flat_items(self.nested_toml_data)
+            if key in field_names
         }
+        if cache_key:
+            _TOML_DATA_CACHE[cache_key, settings_cls] = self.toml_data
             
-        super(TomlConfigSettingsSource, self).__init__(settings_cls, self.toml_data)
+        super(TomlConfigSettingsSource, self).__init__(settings_cls, dict(self.toml_data))
+
+    @staticmethod
+    def _flat_items(nested_toml_data: Dict[str, Any]):
+        for top_level_key, top_level_value in nested_toml_data.items():
+            if isinstance(top_level_value, dict):
+                # value is nested, flatten it
+                yield from top_level_value.items()
+            else:
+                # value is already flat, just yield it as-is
+                yield top_level_key, top_level_value
+
+
+class _LazyConfigView:
+    """
+    Read-only view of a config's current field values, passed to default factory functions as `c`.
+    Values are read from the config on demand, so later factories always see values computed by earlier ones.
+    """
+    __slots__ = ('_config',)
+
+    def __init__(self, config: BaseSettings):
+        self._config = config
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in get_field_names(self._config.__class__):
+            raise KeyError(key)
+        return getattr(self._config, key)
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        return key in get_field_names(self._config.__class__)
+
+    def get(self, key: str, default: Any=None) -> Any:
+        return self[key] if key in self else default
 
 
 class ArchiveBoxBaseConfig(BaseSettings):
@@ -85,7 +180,7 @@ class ArchiveBoxBaseConfig(BaseSettings):
         loc_by_alias=False,
         validate_assignment=True,
         validate_return=True,
-        revalidate_instances="always",
+        revalidate_instances="never",
     )
     
     load_from_defaults: ClassVar[bool] = True
@@ -103,15 +198,17 @@ class ArchiveBoxBaseConfig(BaseSettings):
     ) -> Tuple[PydanticBaseSettingsSource, ...]:
         """Defines the config precedence order: Schema defaults -> ArchiveBox.conf (TOML) -> Environment variables"""
         
-        ARCHIVEBOX_CONFIG_FILE = DATA_DIR / "ArchiveBox.conf"
-        ARCHIVEBOX_CONFIG_FILE_BAK = ARCHIVEBOX_CONFIG_FILE.parent / ".ArchiveBox.conf.bak"
-        
         # import ipdb; ipdb.set_trace()
         
         precedence_order = {}
         
+        try:
+            config_file_stat = os.stat(ARCHIVEBOX_CONFIG_FILE)
+        except OSError:
+            config_file_stat = None
+        
         # if ArchiveBox.conf does not exist yet, return defaults -> env order
-        if not ARCHIVEBOX_CONFIG_FILE.is_file():
+        if not (config_file_stat and stat.S_ISREG(config_file_stat.st_mode)):
             precedence_order = {
                 'defaults': init_settings,
                 'environment': env_settings,
@@ -121,7 +218,7 @@ class ArchiveBoxBaseConfig(BaseSettings):
         try:
             precedence_order = precedence_order or {
                 'defaults': init_settings,
-                'configfile': FlatTomlConfigSettingsSource(settings_cls, toml_file=ARCHIVEBOX_CONFIG_FILE),
+                'configfile': FlatTomlConfigSettingsSource(settings_cls, toml_file=ARCHIVEBOX_CONFIG_FILE, toml_stat=config_file_stat),
                 'environment': env_settings,
             }
         except Exception as err:
@@ -154,21 +251,27 @@ class ArchiveBoxBaseConfig(BaseSettings):
     def fill_defaults(self):
         """Populate any unset values using function provided as their default"""
 
-        for key, field in self.model_fields.items():
+        callable_default_fields = get_callable_default_fields(self.__class__)
+        if not callable_default_fields or self.model_fields_set.issuperset(callable_default_fields):
+            # nothing to fill, every field with a callable default was already provided by a config source
+            return self
+
+        config_so_far = _LazyConfigView(self)
+        for key in callable_default_fields:
+            field = self.model_fields[key]
             value = getattr(self, key)
             
             if isinstance(value, Callable):
                 # if value is a function, execute it to get the actual value, passing existing config as a dict arg if expected
-                if func_takes_args_or_kwargs(value):
-                    # assemble dict of existing field values to pass to default factory functions
-                    config_so_far = benedict(self.model_dump(include=set(self.model_fields.keys()), warnings=False))
+                if cached_func_takes_args_or_kwargs(value):
+                    # pass a live view of the existing field values (supports both c['KEY'] and c.KEY) instead of dumping the whole model
                     computed_default = field.default(config_so_far)
                 else:
                     # otherwise it's a pure function with no args, just call it
                     computed_default = field.default()
 
                 # coerce/check to make sure default factory return value matches type annotation
-                TypeAdapter(field.annotation).validate_python(computed_default)
+                get_type_adapter(field.annotation).validate_python(computed_default)
 
                 # set generated default value as final validated value
                 setattr(self, key, computed_default)
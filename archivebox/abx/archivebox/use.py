@@ -33,11 +33,12 @@ def get_HOOKS(PLUGINS) -> Dict[str, 'BaseHook']:
     })
 
 def get_CONFIGS() -> Dict[str, 'BaseConfigSet']:
-    return benedict({
+    # plain dict, callers only ever iterate the configsets, no keypath access needed
+    return {
         config_id: config
         for plugin_configs in pm.hook.get_CONFIGS()
             for config_id, config in plugin_configs.items()
-    })
+    }
     
 def get_FLAT_CONFIG() -> Dict[str, Any]:
     return benedict({
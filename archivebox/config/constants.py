@@ -3,14 +3,15 @@ __package__ = 'archivebox.config'
 import os
 import re
 import sys
+import stat
 
-from typing import Dict
+from typing import Dict, Any
 from pathlib import Path
 from collections.abc import Mapping
 
 from benedict import benedict
 
-from ..misc.logging import DEFAULT_CLI_COLORS
+from ..misc.logging import DEFAULT_CLI_COLORS, DISABLED_CLI_COLORS
 
 from .paths import (
     PACKAGE_DIR,
@@ -35,6 +36,26 @@ from .version import detect_installed_version
 ###################### Config ##########################
 
 
+def _get_location_info(path: Path, is_dir: bool=True, mode: int=os.R_OK | os.W_OK, optional: bool=False, check_mount: bool=False) -> Dict[str, Any]:
+    """stat a location once and derive its path/enabled/is_valid(/is_mount) info from that, instead of re-stat'ing it for each key"""
+    resolved_path = path.resolve()
+    try:
+        path_stat = os.stat(path)
+        exists = stat.S_ISDIR(path_stat.st_mode) if is_dir else stat.S_ISREG(path_stat.st_mode)
+    except OSError:
+        exists = False
+
+    info = {
+        'path': resolved_path,
+        'enabled': exists if optional else True,
+        'is_valid': exists and os.access(path, mode),
+    }
+    if check_mount:
+        info['is_mount'] = os.path.ismount(resolved_path)
+    return info
+
+
+
 class ConstantsDict(Mapping):
     PACKAGE_DIR: Path                   = PACKAGE_DIR
     DATA_DIR: Path                      = DATA_DIR
@@ -109,7 +130,7 @@ class ConstantsDict(Mapping):
     # Config constants
     TIMEZONE: str                       = 'UTC'
     DEFAULT_CLI_COLORS: Dict[str, str]  = DEFAULT_CLI_COLORS
-    DISABLED_CLI_COLORS: Dict[str, str] = benedict({k: '' for k in DEFAULT_CLI_COLORS})
+    DISABLED_CLI_COLORS: Dict[str, str] = DISABLED_CLI_COLORS
 
     ALLOWDENYLIST_REGEX_FLAGS: int      = re.IGNORECASE | re.UNICODE | re.MULTILINE
 
@@ -201,87 +222,31 @@ class ConstantsDict(Mapping):
 
     CODE_LOCATIONS = benedict({
         'PACKAGE_DIR': {
-            'path': (PACKAGE_DIR).resolve(),
+            'path': PACKAGE_DIR,                    # already resolved in config/paths.py
             'enabled': True,
             'is_valid': os.access(PACKAGE_DIR / '__main__.py', os.X_OK),                                                                  # executable
         },
         'TEMPLATES_DIR': {
-            'path': TEMPLATES_DIR.resolve(),
+            'path': TEMPLATES_DIR,
             'enabled': True,
-            'is_valid': os.access(STATIC_DIR, os.R_OK) and os.access(STATIC_DIR, os.X_OK),                                                # read + list
-        },
-        'CUSTOM_TEMPLATES_DIR': {
-            'path': CUSTOM_TEMPLATES_DIR.resolve(),
-            'enabled': os.path.isdir(CUSTOM_TEMPLATES_DIR),
-            'is_valid': os.path.isdir(CUSTOM_TEMPLATES_DIR) and os.access(CUSTOM_TEMPLATES_DIR, os.R_OK),                                      # read
-        },
-        'USER_PLUGINS_DIR': {
-            'path': USER_PLUGINS_DIR.resolve(),
-            'enabled': os.path.isdir(USER_PLUGINS_DIR),
-            'is_valid': os.path.isdir(USER_PLUGINS_DIR) and os.access(USER_PLUGINS_DIR, os.R_OK),                                              # read
-        },
-        'LIB_DIR': {
-            'path': LIB_DIR.resolve(),
-            'enabled': True,
-            'is_valid': os.path.isdir(LIB_DIR) and os.access(LIB_DIR, os.R_OK) and os.access(LIB_DIR, os.W_OK),                      # read + write
+            'is_valid': os.access(STATIC_DIR, os.R_OK | os.X_OK),                                                                         # read + list
         },
+        'CUSTOM_TEMPLATES_DIR':     _get_location_info(CUSTOM_TEMPLATES_DIR, mode=os.R_OK, optional=True),                              # read
+        'USER_PLUGINS_DIR':         _get_location_info(USER_PLUGINS_DIR, mode=os.R_OK, optional=True),                                  # read
+        'LIB_DIR':                  _get_location_info(LIB_DIR),                                                                        # read + write
     })
         
     DATA_LOCATIONS = benedict({
-        "DATA_DIR": {
-            "path": DATA_DIR.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isdir(DATA_DIR) and os.access(DATA_DIR, os.R_OK) and os.access(DATA_DIR, os.W_OK),
-            "is_mount": os.path.ismount(DATA_DIR.resolve()),
-        },
-        "CONFIG_FILE": {
-            "path": CONFIG_FILE.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isfile(CONFIG_FILE) and os.access(CONFIG_FILE, os.R_OK) and os.access(CONFIG_FILE, os.W_OK),
-        },
-        "SQL_INDEX": {
-            "path": DATABASE_FILE.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isfile(DATABASE_FILE) and os.access(DATABASE_FILE, os.R_OK) and os.access(DATABASE_FILE, os.W_OK),
-            "is_mount": os.path.ismount(DATABASE_FILE.resolve()),
-        },
-        "QUEUE_DATABASE": {
-            "path": QUEUE_DATABASE_FILE.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isfile(QUEUE_DATABASE_FILE) and os.access(QUEUE_DATABASE_FILE, os.R_OK) and os.access(QUEUE_DATABASE_FILE, os.W_OK),
-            "is_mount": os.path.ismount(QUEUE_DATABASE_FILE.resolve()),
-        },
-        "ARCHIVE_DIR": {
-            "path": ARCHIVE_DIR.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isdir(ARCHIVE_DIR) and os.access(ARCHIVE_DIR, os.R_OK) and os.access(ARCHIVE_DIR, os.W_OK),
-            "is_mount": os.path.ismount(ARCHIVE_DIR.resolve()),
-        },
-        "SOURCES_DIR": {
-            "path": SOURCES_DIR.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isdir(SOURCES_DIR) and os.access(SOURCES_DIR, os.R_OK) and os.access(SOURCES_DIR, os.W_OK),
-        },
-        "PERSONAS_DIR": {
-            "path": PERSONAS_DIR.resolve(),
-            "enabled": os.path.isdir(PERSONAS_DIR),
-            "is_valid": os.path.isdir(PERSONAS_DIR) and os.access(PERSONAS_DIR, os.R_OK) and os.access(PERSONAS_DIR, os.W_OK),                 # read + write
-        },
-        "LOGS_DIR": {
-            "path": LOGS_DIR.resolve(),
-            "enabled": True,
-            "is_valid": os.path.isdir(LOGS_DIR) and os.access(LOGS_DIR, os.R_OK) and os.access(LOGS_DIR, os.W_OK),                              # read + write
-        },
-        'TMP_DIR': {
-            'path': TMP_DIR.resolve(),
-            'enabled': True,
-            'is_valid': os.path.isdir(TMP_DIR) and os.access(TMP_DIR, os.R_OK) and os.access(TMP_DIR, os.W_OK),                      # read + write
-        },
-        # "CACHE_DIR": {
-        #     "path": CACHE_DIR.resolve(),
-        #     "enabled": True,
-        #     "is_valid": os.access(CACHE_DIR, os.R_OK) and os.access(CACHE_DIR, os.W_OK),                        # read + write
-        # },
+        "DATA_DIR":                 _get_location_info(DATA_DIR, check_mount=True),
+        "CONFIG_FILE":              _get_location_info(CONFIG_FILE, is_dir=False),
+        "SQL_INDEX":                _get_location_info(DATABASE_FILE, is_dir=False, check_mount=True),
+        "QUEUE_DATABASE":           _get_location_info(QUEUE_DATABASE_FILE, is_dir=False, check_mount=True),
+        "ARCHIVE_DIR":              _get_location_info(ARCHIVE_DIR, check_mount=True),
+        "SOURCES_DIR":              _get_location_info(SOURCES_DIR),
+        "PERSONAS_DIR":             _get_location_info(PERSONAS_DIR, optional=True),                                                    # read + write
+        "LOGS_DIR":                 _get_location_info(LOGS_DIR),                                                                       # read + write
+        'TMP_DIR':                  _get_location_info(TMP_DIR),                                                                        # read + write
+        # "CACHE_DIR":              _get_location_info(CACHE_DIR),                                                                      # read + write
     })
 
     @classmethod
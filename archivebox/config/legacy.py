@@ -27,19 +27,16 @@ import sys
 import json
 import shutil
 
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Type, Tuple, Dict, Any
-from subprocess import run, DEVNULL
-from configparser import ConfigParser
+from typing import Optional, Type, Tuple, Dict, Any, Mapping, Iterable
 
 from rich.progress import Progress
 from rich.console import Console
 from benedict import benedict
 
-import django
-from django.db.backends.sqlite3.base import Database as sqlite3
-
 
 from .constants import CONSTANTS
 from .constants import *
@@ -178,17 +175,30 @@ CONFIG_ALIASES = {
             for alias in default.get('aliases', ())
 }
 USER_CONFIG = {key: section[key] for section in CONFIG_SCHEMA.values() for key in section.keys()}
+# a few keys (e.g. USER_AGENT) are defined in more than one section, they're always written to the first one that defines them
+# (sections are iterated in reverse so the first section's entry is the one left in the dict)
+KEY_TO_SECTION = {key: section_name for section_name, section in reversed(CONFIG_SCHEMA.items()) for key in section.keys()}
+CONFIG_KEYS_AND_ALIASES = frozenset(USER_CONFIG.keys()) | frozenset(CONFIG_ALIASES.keys())
 
+@lru_cache(maxsize=256)
 def get_real_name(key: str) -> str:
     """get the current canonical name for a given deprecated config key"""
-    return CONFIG_ALIASES.get(key.upper().strip(), key.upper().strip())
+    key = key.upper().strip()
+    return CONFIG_ALIASES.get(key, key)
+
 
 
+# most users never change the default URL_DENYLIST, so compile it once at import and reuse it on every config load
+DEFAULT_URL_DENYLIST_PTN = re.compile(ARCHIVING_CONFIG.model_fields['URL_DENYLIST'].default, CONSTANTS.ALLOWDENYLIST_REGEX_FLAGS)
 
 # These are derived/computed values calculated *after* all user-provided config values are ingested
 # they appear in `archivebox config` output and are intended to be read-only for the user
 DYNAMIC_CONFIG_SCHEMA: Dict[str, Any] = {
-    'URL_DENYLIST_PTN':         {'default': lambda c: c['URL_DENYLIST'] and re.compile(c['URL_DENYLIST'] or '', CONSTANTS.ALLOWDENYLIST_REGEX_FLAGS)},
+    'URL_DENYLIST_PTN':         {'default': lambda c: c['URL_DENYLIST'] and (
+                                    DEFAULT_URL_DENYLIST_PTN
+                                    if c['URL_DENYLIST'] == DEFAULT_URL_DENYLIST_PTN.pattern else
+                                    re.compile(c['URL_DENYLIST'], CONSTANTS.ALLOWDENYLIST_REGEX_FLAGS)
+                                )},
     'URL_ALLOWLIST_PTN':        {'default': lambda c: c['URL_ALLOWLIST'] and re.compile(c['URL_ALLOWLIST'] or '', CONSTANTS.ALLOWDENYLIST_REGEX_FLAGS)},
 
     'SAVE_ALLOWLIST_PTN':       {'default': lambda c: c['SAVE_ALLOWLIST'] and {re.compile(k, CONSTANTS.ALLOWDENYLIST_REGEX_FLAGS): v for k, v in c['SAVE_ALLOWLIST'].items()}},
@@ -205,12 +215,12 @@ def load_config_val(key: str,
                     default: Any=None,
                     type: Optional[Type]=None,
                     aliases: Optional[Tuple[str, ...]]=None,
-                    config: Optional[benedict]=None,
+                    config: Optional[Mapping[str, Any]]=None,
                     env_vars: Optional[os._Environ]=None,
                     config_file_vars: Optional[Dict[str, str]]=None) -> Any:
     """parse bool, int, and str key=value pairs from env"""
 
-    assert isinstance(config, dict)
+    assert isinstance(config, Mapping)
 
     is_read_only = type is None
     if is_read_only:
@@ -219,18 +229,23 @@ def load_config_val(key: str,
         return default
 
     # get value from environment variables or config files
-    config_keys_to_check = (key, *(aliases or ()))
-    val = None
-    for key in config_keys_to_check:
-        if env_vars:
-            val = env_vars.get(key)
-            if val:
-                break
-
-        if config_file_vars:
+    if not aliases:
+        # fast path for the majority of keys that have no deprecated aliases
+        val = env_vars.get(key) if env_vars else None
+        if not val and config_file_vars:
             val = config_file_vars.get(key)
-            if val:
-                break
+    else:
+        val = None
+        for key in (key, *aliases):
+            if env_vars:
+                val = env_vars.get(key)
+                if val:
+                    break
+
+            if config_file_vars:
+                val = config_file_vars.get(key)
+                if val:
+                    break
 
     is_unset = val is None
     if is_unset:
@@ -243,9 +258,10 @@ def load_config_val(key: str,
     BOOL_FALSEIES = ('false', 'no', '0')
 
     if type is bool:
-        if val.lower() in BOOL_TRUEIES:
+        lowered = val.lower()
+        if lowered in BOOL_TRUEIES:
             return True
-        elif val.lower() in BOOL_FALSEIES:
+        elif lowered in BOOL_FALSEIES:
             return False
         else:
             raise ValueError(f'Invalid configuration option {key}={val} (expected a boolean: True/False)')
@@ -266,29 +282,73 @@ def load_config_val(key: str,
     raise Exception('Config values can only be str, bool, int, or json')
 
 
-def load_config_file(out_dir: str | None=CONSTANTS.DATA_DIR) -> Optional[benedict]:
+# ArchiveBox.conf is always a flat list of [SECTION] headers and KEY = VALUE lines, reading it doesn't need the
+# full ConfigParser machinery, but values are unescaped and joined the same way ConfigParser would (see below)
+_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=:;#\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+
+def _unescape_config_file_val(key: str, val: str) -> str:
+    # ConfigParser's BasicInterpolation turns %% into %, and rejects any other bare % (we don't support %(name)s refs)
+    if '%' not in val:
+        return val
+    if '%' in val.replace('%%', ''):
+        raise ValueError(f'Invalid configuration option {key}={val} (use %% for a literal %, %(name)s interpolation is not supported)')
+    return val.replace('%%', '%')
+
+@lru_cache(maxsize=8)
+def _load_config_file_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    # mtime_ns and size are only part of the cache key, so any edit to the file invalidates the cached result
+    config_file_lines: Dict[str, list] = {}
+    key, key_indent = None, 0
+    with open(config_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith(('#', ';')):
+                continue
+            if not stripped:
+                # blank lines are kept inside multi-line values (trailing ones are trimmed below)
+                if key:
+                    config_file_lines[key].append('')
+                continue
+            indent = len(line) - len(line.lstrip())
+            if key and indent > key_indent:
+                # lines indented deeper than their KEY = line continue its value, e.g. KEY = [\n    "a",\n    "b"\n    ]
+                config_file_lines[key].append(stripped)
+                continue
+            if _SECTION_RE.match(line):
+                key = None
+                continue
+            kv = _KV_RE.match(line)
+            if kv:
+                key, key_indent = kv.group(1).upper(), indent
+                config_file_lines[key] = [kv.group(2)]
+            else:
+                key = None
+    return {
+        key: _unescape_config_file_val(key, '\n'.join(lines).rstrip('\n'))
+        for key, lines in config_file_lines.items()
+    }
+
+def load_config_file(out_dir: str | None=CONSTANTS.DATA_DIR) -> Optional[Dict[str, str]]:
     """load the ini-formatted config file from DATA_DIR/Archivebox.conf"""
 
     config_path = CONSTANTS.CONFIG_FILE
-    if os.access(config_path, os.R_OK):
-        config_file = ConfigParser()
-        config_file.optionxform = str
-        config_file.read(config_path)
-        # flatten into one namespace
-        config_file_vars = benedict({
-            key.upper(): val
-            for section, options in config_file.items()
-                for key, val in options.items()
-        })
-        # print('[i] Loaded config file', os.path.abspath(config_path))
-        # print(config_file_vars)
-        return config_file_vars
-    return None
+    try:
+        # a single stat() both checks that the file exists and provides the cache key
+        stat = os.stat(config_path)
+        # flatten into one namespace (section headers are only used for grouping, keys are unique)
+        config_file_vars = dict(_load_config_file_cached(str(config_path), stat.st_mtime_ns, stat.st_size))
+    except (FileNotFoundError, PermissionError):
+        return None
+    # print('[i] Loaded config file', os.path.abspath(config_path))
+    # print(config_file_vars)
+    return config_file_vars
 
 
 def write_config_file(config: Dict[str, str], out_dir: str | None=CONSTANTS.DATA_DIR) -> benedict:
     """load the ini-formatted config file from DATA_DIR/Archivebox.conf"""
 
+    from configparser import ConfigParser
     from archivebox.misc.system import atomic_write
 
     CONFIG_HEADER = (
@@ -307,17 +367,24 @@ def write_config_file(config: Dict[str, str], out_dir: str | None=CONSTANTS.DATA
 
     config_path = CONSTANTS.CONFIG_FILE
 
-    if not os.access(config_path, os.F_OK):
-        atomic_write(config_path, CONFIG_HEADER)
+    # normalize the keys once up-front, they're used both to find each key's section and to build the return value
+    config = {key.upper(): val for key, val in config.items()}
+
+    # read the existing file once and reuse its contents for parsing, the .bak copy, and restoring on failure
+    try:
+        with open(config_path, 'r', encoding='utf-8') as old:
+            original_config = old.read()
+    except FileNotFoundError:
+        original_config = CONFIG_HEADER
+        atomic_write(config_path, original_config)
 
     config_file = ConfigParser()
     config_file.optionxform = str
-    config_file.read(config_path)
+    config_file.read_string(original_config)
 
-    with open(config_path, 'r', encoding='utf-8') as old:
-        atomic_write(f'{config_path}.bak', old.read())
+    atomic_write(f'{config_path}.bak', original_config)
 
-    find_section = lambda key: [name for name, opts in CONFIG_SCHEMA.items() if key in opts][0]
+    find_section = KEY_TO_SECTION.__getitem__
 
     # Set up sections in empty config file
     for key, val in config.items():
@@ -350,22 +417,17 @@ def write_config_file(config: Dict[str, str], out_dir: str | None=CONSTANTS.DATA
         CONFIG = load_all_config()
     except BaseException:                                                       # lgtm [py/catch-base-exception]
         # something went horribly wrong, rever to the previous version
-        with open(f'{config_path}.bak', 'r', encoding='utf-8') as old:
-            atomic_write(config_path, old.read())
+        atomic_write(config_path, original_config)
 
         raise
 
-    if os.access(f'{config_path}.bak', os.F_OK):
-        os.remove(f'{config_path}.bak')
+    os.remove(f'{config_path}.bak')
 
-    return benedict({
-        key.upper(): CONFIG.get(key.upper())
-        for key in config.keys()
-    })
+    return benedict({key: CONFIG.get(key) for key in config})
 
 
 
-def load_config(defaults: Dict[str, Any],
+def load_config(defaults: Mapping[str, Dict[str, Any]] | Iterable[Tuple[str, Dict[str, Any]]],
                 config: Optional[benedict]=None,
                 out_dir: Optional[str]=None,
                 env_vars: Optional[os._Environ]=None,
@@ -374,18 +436,25 @@ def load_config(defaults: Dict[str, Any],
     env_vars = env_vars or os.environ
     config_file_vars = config_file_vars or load_config_file(out_dir=out_dir)
 
-    extended_config = benedict(config.copy() if config else {})
-    for key, default in defaults.items():
+    # usually only a handful of keys are actually set in the env or config file, find them up-front
+    # so the rest can skip straight to their defaults without looking themselves up in either
+    present_keys = CONFIG_KEYS_AND_ALIASES & (env_vars.keys() | (config_file_vars or {}).keys())
+
+    # layer the new values over the existing config instead of copying it for every section
+    extended_config = ChainMap({}, config or {})
+    for key, default in (defaults.items() if isinstance(defaults, Mapping) else defaults):
         try:
             # print('LOADING CONFIG KEY:', key, 'DEFAULT=', default)
+            aliases = default.get('aliases')
+            is_present = key in present_keys or (aliases and not present_keys.isdisjoint(aliases))
             extended_config[key] = load_config_val(
                 key,
                 default=default['default'],
                 type=default.get('type'),
-                aliases=default.get('aliases'),
+                aliases=aliases,
                 config=extended_config,
-                env_vars=env_vars,
-                config_file_vars=config_file_vars,
+                env_vars=env_vars if is_present else None,
+                config_file_vars=config_file_vars if is_present else None,
             )
         except KeyboardInterrupt:
             raise SystemExit(0)
@@ -466,17 +535,6 @@ def find_chrome_data_dir() -> Optional[str]:
     #         return full_path
     return None
 
-def wget_supports_compression(config):
-    try:
-        cmd = [
-            config['WGET_BINARY'],
-            "--compression=auto",
-            "--help",
-        ]
-        return not run(cmd, stdout=DEVNULL, stderr=DEVNULL).returncode
-    except (FileNotFoundError, OSError):
-        return False
-
 
 # ******************************************************************************
 # ******************************************************************************
@@ -486,18 +544,38 @@ def wget_supports_compression(config):
 # ******************************************************************************
 
 
-def load_all_config():
-    CONFIG = benedict()
-    for section_name, section_config in CONFIG_SCHEMA.items():
-        # print('LOADING CONFIG SECTION:', section_name)
-        CONFIG = load_config(section_config, CONFIG)
-
-    # print("LOADING CONFIG SECTION:", 'DYNAMIC')
-    return load_config(DYNAMIC_CONFIG_SCHEMA, CONFIG)
+# every section's (key, default) pairs in load order, so all of CONFIG can be computed in a single load_config() pass.
+# kept as pairs instead of a dict because a few keys (e.g. USER_AGENT) are redefined by later sections,
+# and must be re-derived at that position so the keys in between still see the earlier value
+ALL_CONFIG_DEFAULTS: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(
+    (key, default)
+    for section in (*CONFIG_SCHEMA.values(), DYNAMIC_CONFIG_SCHEMA)
+    for key, default in section.items()
+)
 
-# add all final config values in CONFIG to globals in this file
-CONFIG: benedict = load_all_config()
-globals().update(CONFIG)
+def load_all_config():
+    return load_config(ALL_CONFIG_DEFAULTS)
+
+_CONFIG: Optional[benedict] = None
+
+def _load_once() -> benedict:
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = load_all_config()
+        # add all final config values in CONFIG to globals in this file
+        globals().update(_CONFIG)
+        globals()['CONFIG'] = _CONFIG
+    return _CONFIG
+
+def __getattr__(name: str) -> Any:
+    # CONFIG (and every key in it) is only computed on first access, not at import time (PEP 562)
+    if name == 'CONFIG':
+        return _load_once()
+    if name in CONFIG_KEYS_AND_ALIASES or name in DYNAMIC_CONFIG_SCHEMA:
+        config = _load_once()
+        if name in config:
+            return config[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 # print("FINISHED LOADING CONFIG USING SCHEMAS + FILE + ENV")
@@ -552,7 +630,8 @@ def setup_django_minimal():
 DJANGO_SET_UP = False
 
 
-def setup_django(out_dir: Path | None=None, check_db=False, config: benedict=CONFIG, in_memory_db=False) -> None:
+def setup_django(out_dir: Path | None=None, check_db=False, config: benedict | None=None, in_memory_db=False) -> None:
+    import django
     from rich.panel import Panel
     
     global INITIAL_STARTUP_PROGRESS
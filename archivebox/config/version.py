@@ -1,6 +1,7 @@
 __package__ = 'archivebox.config'
 
 import os
+import re
 import importlib.metadata
 
 from pathlib import Path
@@ -13,9 +14,11 @@ from typing import Optional
 IN_DOCKER = os.environ.get('IN_DOCKER', False) in ('1', 'true', 'True', 'TRUE', 'yes')
 
 PACKAGE_DIR: Path = Path(__file__).resolve().parent.parent    # archivebox source code dir
-DATA_DIR: Path = Path(os.getcwd()).resolve()                  # archivebox user data dir
+DATA_DIR: Path = Path(os.getcwd())                            # archivebox user data dir
 ARCHIVE_DIR: Path = DATA_DIR / 'archive'                      # archivebox snapshot data dir
 
+_PYPROJECT_VERSION_RE = re.compile(r'^version = "?([^"\n]+)"?', re.MULTILINE)
+
 #############################################################################################
 
 
@@ -29,11 +32,10 @@ def detect_installed_version(PACKAGE_DIR: Path=PACKAGE_DIR):
         pass
 
     try:
-        # if in dev Git repo dir, use pyproject.toml file
-        pyproject_config = (PACKAGE_DIR.parent / 'pyproject.toml').read_text().split('\n')
-        for line in pyproject_config:
-            if line.startswith('version = '):
-                return line.split(' = ', 1)[-1].strip('"').strip()
+        # if in dev Git repo dir, use pyproject.toml file (only need the one version line, no need to parse the whole file)
+        version = _PYPROJECT_VERSION_RE.search((PACKAGE_DIR.parent / 'pyproject.toml').read_text())
+        if version:
+            return version.group(1).strip()
     except FileNotFoundError:
         # building docs, pyproject.toml is not available
         pass
@@ -298,25 +298,26 @@ class SnapshotView(View):
         #     pass
 
         # slug is a URL
+        url_base = base_url(path)
+        # only the timestamp is needed to redirect, skip instantiating (and prefetching tags/results for) a full Snapshot
+        snapshot_timestamps = Snapshot.objects.prefetch_related(None).values_list('timestamp', flat=True)
         try:
             try:
                 # try exact match on full url / ABID first
-                snapshot = Snapshot.objects.get(
+                timestamp = snapshot_timestamps.get(
                     Q(url='http://' + path) | Q(url='https://' + path) | Q(id__startswith=path)
                     | Q(abid__icontains=path) | Q(id__icontains=path)
                 )
             except Snapshot.DoesNotExist:
                 # fall back to match on exact base_url
                 try:
-                    snapshot = Snapshot.objects.get(
-                        Q(url='http://' + base_url(path)) | Q(url='https://' + base_url(path))
-                    )
+                    timestamp = snapshot_timestamps.get(url__in=('http://' + url_base, 'https://' + url_base))
                 except Snapshot.DoesNotExist:
                     # fall back to matching base_url as prefix
-                    snapshot = Snapshot.objects.get(
-                        Q(url__startswith='http://' + base_url(path)) | Q(url__startswith='https://' + base_url(path))
+                    timestamp = snapshot_timestamps.get(
+                        Q(url__startswith='http://' + url_base) | Q(url__startswith='https://' + url_base)
                     )
-            return redirect(f'/archive/{snapshot.timestamp}/index.html')
+            return redirect(f'/archive/{timestamp}/index.html')
         except Snapshot.DoesNotExist:
             return HttpResponse(
                 format_html(
@@ -327,7 +328,7 @@ class SnapshotView(View):
                         '+ <i><a href="/add/?url={}" target="_top">Add a new Snapshot for <code>{}</code></a><br/><br/></i>'
                         '</center>'
                     ),
-                    base_url(path),
+                    url_base,
                     path if '://' in path else f'https://{path}',
                     path,
                 ),
@@ -346,7 +347,7 @@ class SnapshotView(View):
                     snap.title_stripped[:64] or '',
                 )
                 for snap in Snapshot.objects.filter(
-                    Q(url__startswith='http://' + base_url(path)) | Q(url__startswith='https://' + base_url(path))
+                    Q(url__startswith='http://' + url_base) | Q(url__startswith='https://' + url_base)
                     | Q(abid__icontains=path) | Q(id__icontains=path)
                 ).only('url', 'timestamp', 'title', 'bookmarked_at').order_by('-bookmarked_at')
             )
@@ -355,7 +356,7 @@ class SnapshotView(View):
                     (
                         'Multiple Snapshots match the given URL <code>{}</code><br/><pre>'
                     ),
-                    base_url(path),
+                    url_base,
                 ) + snapshot_hrefs + format_html(
                     (
                         '</pre><br/>'
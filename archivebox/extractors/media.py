@@ -1,5 +1,8 @@
 __package__ = 'archivebox.extractors'
 
+import re
+import os
+
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +12,30 @@ from archivebox.misc.util import enforce_types, is_static_file, dedupe
 from ..logging_util import TimedProgress
 
 
+# yt-dlp output files containing text that should be added to the full-text index (in the order they're indexed)
+INDEX_TEXT_EXTENSIONS = ('.description', '.srt', '.vtt', '.lrc')
+
+# yt-dlp errors that happen too frequently on non-media pages to warrant printing to console (matched in one pass over stderr)
+IGNORED_YTDLP_ERRORS = re.compile('|'.join(re.escape(error) for error in (
+    'ERROR: Unsupported URL',
+    'HTTP Error 404',
+    'HTTP Error 403',
+    'URL could be a direct video link',
+    'Unable to extract container ID',
+)))
+
+
+def _read_text_file(entry: os.DirEntry, errors: str='strict') -> str:
+    """read a whole file found by os.scandir in one os.read() sized from its (cached) DirEntry.stat()"""
+    fd = os.open(entry.path, os.O_RDONLY)
+    try:
+        text = os.read(fd, entry.stat().st_size).decode('utf-8', errors=errors)
+    finally:
+        os.close(fd)
+    # same universal-newline translation as text-mode open() (.srt/.vtt files are often \r\n)
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
 def get_output_path():
     return 'media/'
 
@@ -31,8 +58,15 @@ def should_save_media(link: Link, out_dir: Optional[Path]=None, overwrite: Optio
         return False
 
     out_dir = out_dir or Path(link.link_dir)
-    if not overwrite and (out_dir / get_output_path()).exists():
-        return False
+    if not overwrite:
+        # skip only if a previous run actually saved something, save_media creates media/ before running yt-dlp
+        # so an empty dir (or one with only hidden temp files) just means the last attempt failed
+        try:
+            with os.scandir(out_dir / get_output_path()) as entries:
+                if any(not entry.name.startswith('.') for entry in entries):
+                    return False
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
     return YTDLP_CONFIG.USE_YTDLP
 
@@ -69,11 +103,7 @@ def save_media(link: Link, out_dir: Optional[Path]=None, timeout: int=0) -> Arch
         result = run(cmd, cwd=str(output_path), timeout=timeout + 1, text=True)
         chmod_file(output, cwd=str(out_dir))
         if result.returncode:
-            if ('ERROR: Unsupported URL' in result.stderr
-                or 'HTTP Error 404' in result.stderr
-                or 'HTTP Error 403' in result.stderr
-                or 'URL could be a direct video link' in result.stderr
-                or 'Unable to extract container ID' in result.stderr):
+            if IGNORED_YTDLP_ERRORS.search(result.stderr):
                 # These happen too frequently on non-media pages to warrant printing to console
                 pass
             else:
@@ -89,6 +119,16 @@ def save_media(link: Link, out_dir: Optional[Path]=None, timeout: int=0) -> Arch
         timer.end()
 
     # add video description and subtitles to full-text index
+    # find all the text files in a single pass over the dir instead of globbing once per extension
+    with os.scandir(output_path) as entries:
+        text_files = sorted(
+            (
+                entry for entry in entries
+                if not entry.name.startswith('.') and os.path.splitext(entry.name)[1] in INDEX_TEXT_EXTENSIONS and entry.is_file()
+            ),
+            key=lambda entry: INDEX_TEXT_EXTENSIONS.index(os.path.splitext(entry.name)[1]),
+        )
+
     # Let's try a few different 
     index_texts = [
         # errors:
@@ -100,14 +140,8 @@ def save_media(link: Link, out_dir: Optional[Path]=None, timeout: int=0) -> Arch
         #   file. Characters not supported by the encoding are replaced with
         #   the appropriate XML character reference &#nnn;.
         # There are a few more options described in https://docs.python.org/3/library/functions.html#open
-        text_file.read_text(encoding='utf-8', errors='xmlcharrefreplace').strip()
-        for text_file in (
-            *output_path.glob('*.description'),
-            *output_path.glob('*.srt'),
-            *output_path.glob('*.vtt'),
-            *output_path.glob('*.lrc'),
-            *output_path.glob('*.lrc'),
-        )
+        _read_text_file(text_file, errors='xmlcharrefreplace').strip()
+        for text_file in text_files
     ]
 
     return ArchiveResult(
@@ -276,11 +276,11 @@ class Link:
     def field_names(cls):
         return [f.name for f in fields(cls)]
 
-    @property
+    @cached_property
     def link_dir(self) -> str:
         return str(ARCHIVE_DIR / self.timestamp)
 
-    @property
+    @cached_property
     def archive_path(self) -> str:
         return '{}/{}'.format(CONSTANTS.ARCHIVE_DIR_NAME, self.timestamp)
     
@@ -5,7 +5,6 @@ __package__ = 'archivebox.misc'
 
 import sys
 from typing import Optional, Union, Tuple, List
-from collections import defaultdict
 from random import randint
 
 from benedict import benedict
@@ -38,43 +37,41 @@ DEFAULT_CLI_COLORS = benedict(
         "black": "\033[01;30m",
     }
 )
-ANSI = benedict({k: '' for k in DEFAULT_CLI_COLORS.keys()})
-
-COLOR_DICT = defaultdict(lambda: [(0, 0, 0), (0, 0, 0)], {
-    '00': [(0, 0, 0), (0, 0, 0)],
-    '30': [(0, 0, 0), (0, 0, 0)],
-    '31': [(255, 0, 0), (128, 0, 0)],
-    '32': [(0, 200, 0), (0, 128, 0)],
-    '33': [(255, 255, 0), (128, 128, 0)],
-    '34': [(0, 0, 255), (0, 0, 128)],
-    '35': [(255, 0, 255), (128, 0, 128)],
-    '36': [(0, 255, 255), (0, 128, 128)],
-    '37': [(255, 255, 255), (255, 255, 255)],
-})
+DISABLED_CLI_COLORS = benedict({k: '' for k in DEFAULT_CLI_COLORS.keys()})
+ANSI = DISABLED_CLI_COLORS
+
+# (prefix, suffix) pairs to wrap each line with, pre-built so logging a line only needs one lookup
+COLOR_WRAP = {name: (code, DEFAULT_CLI_COLORS['reset']) for name, code in DEFAULT_CLI_COLORS.items()}
+NO_COLOR_WRAP = {name: ('', '') for name in DEFAULT_CLI_COLORS.keys()}
+
+DEFAULT_COLOR_PAIR = ((0, 0, 0), (0, 0, 0))
+COLOR_DICT = {
+    '00': DEFAULT_COLOR_PAIR,
+    '30': DEFAULT_COLOR_PAIR,
+    '31': ((255, 0, 0), (128, 0, 0)),
+    '32': ((0, 200, 0), (0, 128, 0)),
+    '33': ((255, 255, 0), (128, 128, 0)),
+    '34': ((0, 0, 255), (0, 0, 128)),
+    '35': ((255, 0, 255), (128, 0, 128)),
+    '36': ((0, 255, 255), (0, 128, 128)),
+    '37': ((255, 255, 255), (255, 255, 255)),
+}
 
 # Logging Helpers (DEPRECATED, use rich.print instead going forward)
 def stdout(*args, color: Optional[str]=None, prefix: str='', config: Optional[benedict]=None) -> None:
-    ansi = DEFAULT_CLI_COLORS if (config or {}).get('USE_COLOR') else ANSI
+    wrap = COLOR_WRAP if config and config.get('USE_COLOR') else NO_COLOR_WRAP
+    pre, post = wrap[color] if color else ('', '')
 
-    if color:
-        strs = [ansi[color], ' '.join(str(a) for a in args), ansi['reset'], '\n']
-    else:
-        strs = [' '.join(str(a) for a in args), '\n']
-
-    sys.stdout.write(prefix + ''.join(strs))
+    sys.stdout.write(f"{prefix}{pre}{' '.join(str(a) for a in args)}{post}\n")
 
 def stderr(*args, color: Optional[str]=None, prefix: str='', config: Optional[benedict]=None) -> None:
-    ansi = DEFAULT_CLI_COLORS if (config or {}).get('USE_COLOR') else ANSI
-
-    if color:
-        strs = [ansi[color], ' '.join(str(a) for a in args), ansi['reset'], '\n']
-    else:
-        strs = [' '.join(str(a) for a in args), '\n']
+    wrap = COLOR_WRAP if config and config.get('USE_COLOR') else NO_COLOR_WRAP
+    pre, post = wrap[color] if color else ('', '')
 
-    sys.stderr.write(prefix + ''.join(strs))
+    sys.stderr.write(f"{prefix}{pre}{' '.join(str(a) for a in args)}{post}\n")
 
 def hint(text: Union[Tuple[str, ...], List[str], str], prefix='    ', config: Optional[benedict]=None) -> None:
-    ansi = DEFAULT_CLI_COLORS if (config or {}).get('USE_COLOR') else ANSI
+    ansi = DEFAULT_CLI_COLORS if config and config.get('USE_COLOR') else DISABLED_CLI_COLORS
 
     if isinstance(text, str):
         stderr('{}{lightred}Hint:{reset} {}'.format(prefix, text, **ansi))
@@ -8,6 +8,7 @@ import re
 import configparser
 
 from pathlib import Path, PosixPath
+from functools import lru_cache
 
 from pydantic.json_schema import GenerateJsonSchema
 from pydantic_core import to_jsonable_python
@@ -92,7 +93,7 @@ class JSONSchemaWithLambdas(GenerateJsonSchema):
     # inspect.getsource(field.wrapped_property.fget).split('def ', 1)[-1].split('\n', 1)[-1].strip().strip('return '),
 
 
-def better_toml_dump_str(val: Any) -> str:
+def _toml_dump_str(val: Any) -> str:
     try:
         return toml.encoder._dump_str(val)     # type: ignore
     except Exception:
@@ -100,6 +101,15 @@ def better_toml_dump_str(val: Any) -> str:
         # fall back to using json representation of string
         return json.dumps(str(val))
 
+# the same handful of strings (paths, flags, binary names, etc.) get encoded over and over across dumps
+_cached_toml_dump_str = lru_cache(maxsize=4096)(_toml_dump_str)
+
+def better_toml_dump_str(val: Any) -> str:
+    if type(val) is str:
+        return _cached_toml_dump_str(val)
+    # don't cache other types (e.g. re.RegexFlag), they can hash + compare equal to plain ints
+    return _toml_dump_str(val)
+
 class CustomTOMLEncoder(toml.encoder.TomlEncoder):
     """
     Custom TomlEncoder to work around https://github.com/uiri/toml's many encoding bugs.
@@ -28,7 +28,7 @@ except ImportError:
 from archivebox.config import CONSTANTS
 from archivebox.config.common import ARCHIVING_CONFIG
 
-from .logging import COLOR_DICT
+from .logging import COLOR_DICT, DEFAULT_COLOR_PAIR
 
 
 ### Parsing Helpers
@@ -120,7 +120,9 @@ def find_all_urls(urls_str: str):
 
 def is_static_file(url: str):
     # TODO: the proper way is with MIME type detection + ext, not only extension
-    return extension(url).lower() in CONSTANTS.STATICFILE_EXTENSIONS
+    # same as extension(url), but only parses the url once since this runs for every url in every extractor
+    filename = urlparse(url).path.rsplit('/', 1)[-1]
+    return '.' in filename and filename.rpartition('.')[-1].lower() in CONSTANTS.STATICFILE_EXTENSIONS
 
 
 def enforce_types(func):
@@ -279,28 +281,29 @@ def get_headers(url: str, timeout: int=None) -> str:
     )
 
 
+ANSI_HTML_TEMPLATE = '<span style="color: rgb{}"><br>'
+
+def _ansi_color_to_html(match) -> str:
+    argsdict = match.groupdict()
+    if argsdict['arg_3'] is None:
+        if argsdict['arg_2'] is None:
+            _, color = 0, argsdict['arg_1']
+        else:
+            _, color = argsdict['arg_1'], argsdict['arg_2']
+    else:
+        _, color = argsdict['arg_3'], argsdict['arg_2']
+
+    return ANSI_HTML_TEMPLATE.format(COLOR_DICT.get(color, DEFAULT_COLOR_PAIR)[0])
+
 @enforce_types
 def ansi_to_html(text: str) -> str:
     """
     Based on: https://stackoverflow.com/questions/19212665/python-converting-ansi-color-codes-to-html
     """
 
-    TEMPLATE = '<span style="color: rgb{}"><br>'
     text = text.replace('[m', '</span>')
 
-    def single_sub(match):
-        argsdict = match.groupdict()
-        if argsdict['arg_3'] is None:
-            if argsdict['arg_2'] is None:
-                _, color = 0, argsdict['arg_1']
-            else:
-                _, color = argsdict['arg_1'], argsdict['arg_2']
-        else:
-            _, color = argsdict['arg_3'], argsdict['arg_2']
-
-        return TEMPLATE.format(COLOR_DICT[color][0])
-
-    return COLOR_REGEX.sub(single_sub, text)
+    return COLOR_REGEX.sub(_ansi_color_to_html, text)
 
 
 @enforce_types
@@ -140,7 +140,7 @@ class ChromeConfig(BaseConfigSet):
         # if user has specified a user data dir, make sure its valid
         if self.CHROME_USER_DATA_DIR and os.access(self.CHROME_USER_DATA_DIR, os.R_OK):
             # check to make sure user_data_dir/<profile_name> exists
-            if not (self.CHROME_USER_DATA_DIR / self.CHROME_PROFILE_NAME).is_dir():
+            if not os.path.isdir(os.path.join(self.CHROME_USER_DATA_DIR, self.CHROME_PROFILE_NAME)):
                 print(f'[red][X] Could not find profile "{self.CHROME_PROFILE_NAME}" in CHROME_USER_DATA_DIR.[/red]', file=sys.stderr)
                 print(f'    {self.CHROME_USER_DATA_DIR}', file=sys.stderr)
                 print('    Make sure you set it to a Chrome user data directory containing a Default profile folder.', file=sys.stderr)
@@ -3,7 +3,6 @@ __package__ = 'plugins_extractor.wget'
 import sys
 from typing import List, Optional
 from pathlib import Path
-from subprocess import run, DEVNULL
 
 from rich import print
 from pydantic import InstanceOf, Field, model_validator
@@ -15,7 +14,7 @@ from abx.archivebox.base_binary import BaseBinary, env, apt, brew
 from abx.archivebox.base_extractor import BaseExtractor, ExtractorName
 
 from archivebox.config.common import ARCHIVING_CONFIG, STORAGE_CONFIG
-from .wget_util import wget_output_path
+from .wget_util import wget_output_path, wget_supports_compression
 
 
 class WgetConfig(BaseConfigSet):
@@ -62,17 +61,9 @@ class WgetConfig(BaseConfigSet):
     def WGET_AUTO_COMPRESSION(self) -> bool:
         if hasattr(self, '_WGET_AUTO_COMPRESSION'):
             return self._WGET_AUTO_COMPRESSION
-        try:
-            cmd = [
-                self.WGET_BINARY,
-                "--compression=auto",
-                "--help",
-            ]
-            self._WGET_AUTO_COMPRESSION = not run(cmd, stdout=DEVNULL, stderr=DEVNULL, timeout=3).returncode
-            return self._WGET_AUTO_COMPRESSION
-        except (FileNotFoundError, OSError):
-            self._WGET_AUTO_COMPRESSION = False
-            return False
+        # only resolve + stat the binary once per instance, this is read on every wget run
+        self._WGET_AUTO_COMPRESSION = wget_supports_compression(self.WGET_BINARY)
+        return self._WGET_AUTO_COMPRESSION
 
 WGET_CONFIG = WgetConfig()
 
@@ -2,7 +2,10 @@ __package__ = 'archivebox.extractors'
 
 import re
 import os
+import shutil
 from pathlib import Path
+from functools import lru_cache
+from subprocess import run, DEVNULL
 
 from typing import Optional
 
@@ -16,6 +19,30 @@ from archivebox.misc.util import (
     urldecode,
 )
 
+@lru_cache(maxsize=None)
+def _wget_supports_compression(wget_abspath: str, mtime_ns: int) -> bool:
+    try:
+        cmd = [
+            wget_abspath,
+            "--compression=auto",
+            "--help",
+        ]
+        return not run(cmd, stdout=DEVNULL, stderr=DEVNULL, timeout=3).returncode
+    except (FileNotFoundError, OSError):
+        return False
+
+def wget_supports_compression(wget_binary: str) -> bool:
+    """check if wget accepts --compression=auto, only spawning wget again if the binary changed on disk"""
+    wget_abspath = shutil.which(wget_binary)
+    if not wget_abspath:
+        return False
+    try:
+        mtime_ns = os.stat(wget_abspath).st_mtime_ns
+    except OSError:
+        return False
+    return _wget_supports_compression(wget_abspath, mtime_ns)
+
+
 @enforce_types
 def unsafe_wget_output_path(link) -> Optional[str]:
     # There used to be a bunch of complex reverse-engineering path mapping logic here,
@@ -160,3 +160,23 @@ def test_headers_400_plus(tmp_path, process, disable_extractors_dict):
     with open(output_file, 'r', encoding='utf-8') as f:
         headers = pyjson.load(f)
     assert headers["Status-Code"] == "200"
+
+def test_should_save_media_retries_empty_media_dir(tmp_path):
+    from archivebox.extractors.media import should_save_media
+    from archivebox.index.schema import Link
+    link = Link(timestamp='1', url='http://127.0.0.1:8080/static/example.com.html', title=None, tags=None, sources=[])
+    link_dir = tmp_path / 'archive' / link.timestamp
+    # a previous failed attempt leaves behind an empty media/ dir (or one with only hidden temp files)
+    (link_dir / 'media').mkdir(parents=True)
+    (link_dir / 'media' / '.partial.tmp').write_text('')
+    assert should_save_media(link, out_dir=link_dir)
+
+def test_should_save_media_skips_populated_media_dir(tmp_path):
+    from archivebox.extractors.media import should_save_media
+    from archivebox.index.schema import Link
+    link = Link(timestamp='1', url='http://127.0.0.1:8080/static/example.com.html', title=None, tags=None, sources=[])
+    link_dir = tmp_path / 'archive' / link.timestamp
+    (link_dir / 'media').mkdir(parents=True)
+    (link_dir / 'media' / 'video.mp4').write_text('')
+    assert not should_save_media(link, out_dir=link_dir)
+    assert should_save_media(link, out_dir=link_dir, overwrite=True)
@@ -176,3 +176,15 @@ def test_tags_migration(tmp_path, disable_extractors_dict):
         tag_name = tag["name"]
         # Check each tag migrated is in the previous field
         assert tag_name in snapshots_dict[snapshot_id]
+
+def test_config_set_writes_duplicate_key_to_first_section(tmp_path, process):
+    # USER_AGENT is defined in both ARCHIVING_CONFIG and ARCHIVE_METHOD_OPTIONS, it should be written to the first one
+    from configparser import ConfigParser
+    os.chdir(tmp_path)
+    subprocess.run(['archivebox', 'config', '--set', 'USER_AGENT=test-user-agent'], capture_output=True)
+
+    config_file = ConfigParser()
+    config_file.optionxform = str
+    config_file.read(tmp_path / "ArchiveBox.conf")
+    assert config_file["ARCHIVING_CONFIG"]["USER_AGENT"] == "test-user-agent"
+    assert not config_file.has_option("ARCHIVE_METHOD_OPTIONS", "USER_AGENT")